@@ -11,16 +11,6 @@ from sqlmodel import SQLModel  # noqa: E402
 
 from app.models import quiz_models  # noqa: E402, F401
 
-try:
-    from app.db.session import engine as app_engine
-
-    if app_engine is None:
-        raise ImportError("Database engine is not initialized in app.core.session")
-except ImportError as e:
-    print(f"Error importing database engine: {e}")
-    print("Ensure app.core.session.engine is correctly initialized.")
-    sys.exit(1)
-
 target_metadata = SQLModel.metadata
 
 # this is the Alembic Config object, which provides
@@ -32,12 +22,6 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name, disable_existing_loggers=False)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
-
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -56,15 +40,11 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    try:
-        from app.core.config import settings
+    from app.core.config import settings
 
-        if settings.DATABASE_URL is None:
-            raise ValueError("settings.DATABASE_URL is not configured.")
-        url = str(settings.DATABASE_URL)
-    except Exception as e:
-        print(f"Error getting DATABASE_URL from settings for offline mode: {e}")
-        sys.exit(1)
+    if settings.DATABASE_URL is None:
+        raise ValueError("settings.DATABASE_URL is not configured.")
+    url = str(settings.DATABASE_URL)
 
     context.configure(
         url=url,
@@ -83,8 +63,14 @@ def run_migrations_online() -> None:
     In this scenario we need to create an Engine
     and associate a connection with the context.
 
+    The app engine is async (asyncpg); migrations run over a plain
+    sync engine built from the same DSN so alembic stays on psycopg2.
     """
-    connectable = app_engine
+    from sqlalchemy import create_engine
+
+    from app.core.config import settings
+
+    connectable = create_engine(str(settings.DATABASE_URL))
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
@@ -0,0 +1,28 @@
+"""Add GIN index for quiz tag matching
+
+Revision ID: a1b9e4c27f05
+Revises:
+Create Date: 2026-08-28 10:12:45.318274
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a1b9e4c27f05"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Expression index matching the `tags::jsonb` cast used by
+    # quiz_crud.get_quizzes_by_tags; serves both @> and ?| operators.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS quiz_tags_gin_idx "
+        "ON quiz USING gin ((tags::jsonb))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS quiz_tags_gin_idx")
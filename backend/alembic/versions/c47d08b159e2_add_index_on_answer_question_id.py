@@ -0,0 +1,26 @@
+"""Add index on answer.question_id
+
+Revision ID: c47d08b159e2
+Revises: a1b9e4c27f05
+Create Date: 2026-08-28 10:58:02.104531
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c47d08b159e2"
+down_revision = "a1b9e4c27f05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Postgres does not index FK columns automatically; the selectinload
+    # batch for question answers filters on question_id IN (...) for every
+    # quiz read.
+    op.create_index("ix_answer_question_id", "answer", ["question_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_answer_question_id", table_name="answer")
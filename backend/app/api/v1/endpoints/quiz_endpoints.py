@@ -1,18 +1,22 @@
 import logging
-from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud import quiz_crud
 from app.db.session import get_db
 from app.schemas import quiz_schemas
 from app.services import quiz_services
+from app.utils.responses import ORJSONResponse, etag_json_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Catalog data only changes when a new quiz is generated; let clients and
+# shared caches reuse responses briefly and revalidate with the ETag after.
+_CATALOG_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
 
 @router.post(
     "/generate-quiz/",
@@ -24,7 +28,7 @@ router = APIRouter()
 )
 async def generate_quiz_from_jd(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_data: quiz_schemas.GenerateQuizRequest,
 ):
     logger.info(
@@ -55,7 +59,7 @@ async def generate_quiz_from_jd(
 )
 async def match_existing_quizzes(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_data: quiz_schemas.MatchQuizRequest,
 ):
     if not request_data.job_description_text and not request_data.tags:
@@ -90,83 +94,117 @@ async def match_existing_quizzes(
 
 @router.get(
     "/job-descriptions/",
-    response_model=List[quiz_schemas.JobDescriptionRead],
+    response_class=ORJSONResponse,
     summary="List Job Descriptions",
     description="Retrieves a list of job descriptions with pagination.",
     tags=["Job Descriptions"],
 )
-def read_job_descriptions(
+async def read_job_descriptions(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(
         100, ge=1, le=200, description="Maximum number of items to return"
     ),
+    after_id: int | None = Query(
+        None, ge=0, description="Return items with an ID greater than this value"
+    ),
 ):
-    jds = quiz_crud.get_job_descriptions(db=db, skip=skip, limit=limit)
-    return jds
+    jds = await quiz_crud.get_job_descriptions(
+        db=db, skip=skip, limit=limit, after_id=after_id
+    )
+    return etag_json_response(
+        request,
+        [
+            quiz_schemas.JobDescriptionRead.model_validate(jd).model_dump(mode="json")
+            for jd in jds
+        ],
+        headers=_CATALOG_CACHE_HEADERS,
+    )
 
 
 @router.get(
     "/job-descriptions/{jd_id}",
-    response_model=quiz_schemas.JobDescriptionRead,
+    response_class=ORJSONResponse,
     summary="Get Job Description by ID",
     description="Retrieves details of a specific job description, including minimal info about its generated quiz if available.",
     tags=["Job Descriptions"],
 )
-def read_job_description(
+async def read_job_description(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     jd_id: int,
 ):
-    db_jd = quiz_crud.get_job_description(db=db, jd_id=jd_id)
+    db_jd = await quiz_crud.get_job_description(db=db, jd_id=jd_id)
     if db_jd is None:
         logger.warning(f"Job Description with ID {jd_id} not found.")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job Description with ID {jd_id} not found",
         )
-    # db.refresh(db_jd, attribute_names=['generated_quiz']) # Might be needed depending on lazy loading config
-    return db_jd
+    return etag_json_response(
+        request,
+        quiz_schemas.JobDescriptionRead.model_validate(db_jd).model_dump(mode="json"),
+        headers=_CATALOG_CACHE_HEADERS,
+    )
 
 
 @router.get(
     "/quizzes/",
-    response_model=List[quiz_schemas.QuizRead],
+    response_class=ORJSONResponse,
     summary="List Quizzes",
     description="Retrieves a list of quizzes with pagination, including their questions.",
     tags=["Quizzes"],
 )
-def read_quizzes(
+async def read_quizzes(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(
         100, ge=1, le=200, description="Maximum number of items to return"
     ),
+    after_id: int | None = Query(
+        None, ge=0, description="Return items with an ID greater than this value"
+    ),
 ):
-    quizzes = quiz_crud.get_quizzes(db=db, skip=skip, limit=limit)
-    return quizzes
+    quizzes = await quiz_crud.get_quizzes(
+        db=db, skip=skip, limit=limit, after_id=after_id
+    )
+    return etag_json_response(
+        request,
+        [
+            quiz_schemas.QuizRead.model_validate(quiz).model_dump(mode="json")
+            for quiz in quizzes
+        ],
+        headers=_CATALOG_CACHE_HEADERS,
+    )
 
 
 @router.get(
     "/quizzes/{quiz_id}",
-    response_model=quiz_schemas.QuizRead,
+    response_class=ORJSONResponse,
     summary="Get Quiz by ID",
     description="Retrieves details of a specific quiz, including its questions and answers.",
     tags=["Quizzes"],
 )
-def read_quiz(
+async def read_quiz(
     *,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     quiz_id: int,
 ):
-    db_quiz = quiz_crud.get_quiz(db=db, quiz_id=quiz_id)
+    db_quiz = await quiz_crud.get_quiz(db=db, quiz_id=quiz_id)
     if db_quiz is None:
         logger.warning(f"Quiz with ID {quiz_id} not found.")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Quiz with ID {quiz_id} not found",
         )
-    # db.refresh(db_quiz, attribute_names=['questions'])
-    return db_quiz
+    return etag_json_response(
+        request,
+        quiz_schemas.QuizRead.model_validate(db_quiz).model_dump(mode="json"),
+        headers=_CATALOG_CACHE_HEADERS,
+    )
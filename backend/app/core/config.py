@@ -1,42 +1,55 @@
 import logging
 import os
-from functools import lru_cache
 
 from dotenv import load_dotenv
 from pydantic import PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
+# Only hydrate os.environ from .env during local development; deployed
+# environments inject real env vars and should not pay the file scan
+# (pydantic-settings still reads env_file itself as a fallback).
+if os.getenv("ENVIRONMENT", "development").lower() == "development":
+    load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
 class Settings(BaseSettings):
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT")
-
-    LOCAL_POSTGRES_SERVER: str = os.getenv("LOCAL_POSTGRES_SERVER")
-    LOCAL_POSTGRES_PORT: str = os.getenv("LOCAL_POSTGRES_PORT")
-    LOCAL_POSTGRES_USER: str = os.getenv("LOCAL_POSTGRES_USER")
-    LOCAL_POSTGRES_PASSWORD: str = os.getenv("LOCAL_POSTGRES_PASSWORD")
-    LOCAL_POSTGRES_DB: str = os.getenv("LOCAL_POSTGRES_DB")
-
-    CLOUD_SQL_INSTANCE_CONNECTION_NAME: str = os.getenv(
-        "CLOUD_SQL_INSTANCE_CONNECTION_NAME"
-    )
-    CLOUD_POSTGRES_SERVER: str = os.getenv("CLOUD_POSTGRES_SERVER")
-    CLOUD_POSTGRES_PORT: str = os.getenv("CLOUD_POSTGRES_PORT")
-    CLOUD_POSTGRES_USER: str = os.getenv("CLOUD_POSTGRES_USER")
-    CLOUD_POSTGRES_PASSWORD: str = os.getenv("CLOUD_POSTGRES_PASSWORD")
-    CLOUD_POSTGRES_DB: str = os.getenv("CLOUD_POSTGRES_DB")
+    # Values come straight from the environment (or env_file) via
+    # pydantic-settings; os.getenv defaults here would read every variable
+    # a second time at class-definition time.
+    ENVIRONMENT: str = "development"
+
+    LOCAL_POSTGRES_SERVER: str | None = None
+    LOCAL_POSTGRES_PORT: str = "5432"
+    LOCAL_POSTGRES_USER: str | None = None
+    LOCAL_POSTGRES_PASSWORD: str | None = None
+    LOCAL_POSTGRES_DB: str | None = None
+
+    CLOUD_SQL_INSTANCE_CONNECTION_NAME: str | None = None
+    CLOUD_POSTGRES_SERVER: str | None = None
+    CLOUD_POSTGRES_PORT: str = "5432"
+    CLOUD_POSTGRES_USER: str | None = None
+    CLOUD_POSTGRES_PASSWORD: str | None = None
+    CLOUD_POSTGRES_DB: str | None = None
 
     DATABASE_URL: PostgresDsn | None = None
 
-    GCP_PROJECT_ID: str = os.getenv("GCP_PROJECT_ID")
-    GCP_LOCATION: str = os.getenv("GCP_LOCATION")
+    # Connection pool sizing; defaults suit a single uvicorn worker against
+    # a small Cloud SQL instance. Tune per deployment via env vars.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+
+    GCP_PROJECT_ID: str | None = None
+    GCP_LOCATION: str | None = None
 
-    VERTEX_AI_MODEL_NAME: str = os.getenv("VERTEX_AI_MODEL_NAME")
+    VERTEX_AI_MODEL_NAME: str | None = None
+    # Cap on concurrent Vertex generate calls per worker; keeps a burst of
+    # quiz generations from tripping the project quota.
+    VERTEX_CONCURRENCY: int = 4
 
-    API_V1_STR: str = os.getenv("API_V1_STR")
+    API_V1_STR: str = "/api/v1"
 
     model_config = SettingsConfigDict(
         case_sensitive=True, env_file=".env", env_file_encoding="utf-8", extra="ignore"
@@ -75,8 +88,7 @@ def build_database_url(settings: Settings) -> PostgresDsn:
         )
 
 
-@lru_cache()
-def get_settings() -> Settings:
+def _build_settings() -> Settings:
     try:
         instance = Settings()
 
@@ -97,4 +109,6 @@ def get_settings() -> Settings:
         )
 
 
-settings: Settings = get_settings()
+# Built exactly once at import; consumers grab the module attribute directly
+# instead of paying an lru_cache lookup per access.
+settings: Settings = _build_settings()
@@ -1,6 +1,10 @@
 from typing import List, Optional, Sequence
 
-from sqlmodel import Session, select
+from sqlalchemy import bindparam, cast
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.quiz_models import (
     Answer,
@@ -8,34 +12,73 @@ from app.models.quiz_models import (
     JobDescription,
     Question,
     Quiz,
+    QuizQuestionLink,
 )
 from app.schemas.quiz_schemas import JobDescriptionCreate, QuestionCreate
 
+# Loader option trees are built once at import; constructing the
+# selectinload/joinedload chains per call re-resolves the relationship
+# attributes every time for an identical result.
+_QUIZ_LOAD_OPTIONS = (
+    selectinload(Quiz.questions).selectinload(Question.answers),
+    joinedload(Quiz.source_jd),
+)
+_JD_LOAD_OPTIONS = (joinedload(JobDescription.generated_quiz),)
+
+
+def normalize_tags(tags: Optional[List[str]]) -> Optional[List[str]]:
+    """Lowercase, strip, dedupe and sort a tag list.
 
-def create_job_description(
-    db: Session, *, jd_in: JobDescriptionCreate
+    Applied once at write time so matching never needs to re-normalize
+    stored rows; queries normalize only the incoming tags.
+    """
+    if not tags:
+        return tags
+    return sorted({tag.strip().lower() for tag in tags if tag and tag.strip()})
+
+
+async def create_job_description(
+    db: AsyncSession, *, jd_in: JobDescriptionCreate
 ) -> JobDescription:
     db_jd = JobDescription.model_validate(jd_in)
     db.add(db_jd)
-    db.commit()
-    db.refresh(db_jd)
+    await db.commit()
+    await db.refresh(db_jd)
     return db_jd
 
 
-def get_job_description(db: Session, jd_id: int) -> JobDescription | None:
-    return db.get(JobDescription, jd_id)
+async def get_job_description(db: AsyncSession, jd_id: int) -> JobDescription | None:
+    statement = (
+        select(JobDescription)
+        .where(JobDescription.id == jd_id)
+        .options(*_JD_LOAD_OPTIONS)
+    )
+    result = await db.exec(statement)
+    return result.first()
 
 
-def get_job_descriptions(
-    db: Session, skip: int = 0, limit: int = 100
+async def get_job_descriptions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
 ) -> Sequence[JobDescription]:
-    statement = select(JobDescription).offset(skip).limit(limit)
-    result = db.exec(statement)
+    statement = (
+        select(JobDescription)
+        .options(*_JD_LOAD_OPTIONS)
+        .order_by(JobDescription.id)
+    )
+    if after_id is not None:
+        # Keyset pagination: an index seek instead of scanning `skip` rows.
+        statement = statement.where(JobDescription.id > after_id)
+    else:
+        statement = statement.offset(skip)
+    result = await db.exec(statement.limit(limit))
     return result.all()
 
 
-def create_quiz_linked_to_jd(
-    db: Session,
+async def create_quiz_linked_to_jd(
+    db: AsyncSession,
     *,
     source_jd: JobDescription,
     title: str,
@@ -45,7 +88,8 @@ def create_quiz_linked_to_jd(
     questions: List[Question],
     description: Optional[str] = None,
 ) -> Quiz:
-    if source_jd.generated_quiz is not None:
+    existing_quiz = await get_quiz_by_jd_id(db, jd_id=source_jd.id)
+    if existing_quiz is not None:
         raise ValueError(
             f"Job Description {source_jd.id} already has a generated quiz."
         )
@@ -55,93 +99,151 @@ def create_quiz_linked_to_jd(
         description=description,
         difficulty=difficulty,
         time_limit_seconds=time_limit_seconds,
-        tags=tags,
+        tags=normalize_tags(tags),
         source_jd_id=source_jd.id,  # Link by ID
-        questions=questions,
     )
     db.add(db_quiz)
-    db.commit()
-    db.refresh(db_quiz)
-    # db.refresh(source_jd) # uncomment if you directly return or use source_jd afterwards
+    await db.flush()
+
+    # Link questions explicitly through the association table; appending to
+    # the ORM relationship would trigger lazy loads that are not allowed on
+    # an AsyncSession.
+    db.add_all(
+        QuizQuestionLink(quiz_id=db_quiz.id, question_id=question.id)
+        for question in questions
+    )
+
+    await db.commit()
+    await db.refresh(db_quiz)
     return db_quiz
 
 
-def get_quiz(db: Session, quiz_id: int) -> Quiz | None:
-    return db.get(Quiz, quiz_id)
+async def get_quiz(db: AsyncSession, quiz_id: int) -> Quiz | None:
+    statement = (
+        select(Quiz)
+        .where(Quiz.id == quiz_id)
+        .options(*_QUIZ_LOAD_OPTIONS)
+    )
+    result = await db.exec(statement)
+    return result.first()
 
 
-def get_quiz_by_jd_id(db: Session, jd_id: int) -> Quiz | None:
+async def get_quiz_by_jd_id(db: AsyncSession, jd_id: int) -> Quiz | None:
     statement = select(Quiz).where(Quiz.source_jd_id == jd_id)
-    result = db.exec(statement)
+    result = await db.exec(statement)
     return result.first()
 
 
-def get_quizzes(db: Session, skip: int = 0, limit: int = 100) -> Sequence[Quiz]:
-    statement = select(Quiz).offset(skip).limit(limit)
-    result = db.exec(statement)
+async def get_quizzes(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Quiz]:
+    statement = (
+        select(Quiz)
+        .options(*_QUIZ_LOAD_OPTIONS)
+        .order_by(Quiz.id)
+    )
+    if after_id is not None:
+        statement = statement.where(Quiz.id > after_id)
+    else:
+        statement = statement.offset(skip)
+    result = await db.exec(statement.limit(limit))
     return result.all()
 
 
-def get_quizzes_by_tags(
-    db: Session, tags_to_match: List[str], require_all: bool = False, limit: int = 50
+async def get_quizzes_by_tags(
+    db: AsyncSession,
+    tags_to_match: List[str],
+    require_all: bool = False,
+    limit: int = 50,
 ) -> Sequence[Quiz]:
     statement = select(Quiz)
+    tags_to_match = normalize_tags(tags_to_match) or []
     if tags_to_match:
-        from sqlalchemy.dialects.postgresql import JSONB
-
+        # tags is stored as JSON; the cast to JSONB matches the expression
+        # GIN index (quiz_tags_gin_idx), so both operators resolve via an
+        # index scan: @> for "all tags present", ?| for "any tag present".
+        tags_jsonb = cast(Quiz.tags, JSONB)
         if require_all:
-            statement = statement.where(
-                Quiz.tags.astext.cast(JSONB).contains(tags_to_match)
-            )
+            statement = statement.where(tags_jsonb.contains(tags_to_match))
         else:
-            statement = statement.where(
-                Quiz.tags.astext.cast(JSONB).overlap(tags_to_match)
-            )
-            pass
+            statement = statement.where(tags_jsonb.has_any(array(tags_to_match)))
 
-    statement = statement.limit(limit)
-    results = db.exec(statement)
+    # Bind the limit instead of inlining it so every call shares one
+    # statement shape in asyncpg's prepared-statement cache.
+    statement = statement.limit(bindparam("match_limit"))
+    results = await db.exec(statement, params={"match_limit": limit})
     return results.all()
 
 
-def create_question(db: Session, *, question_in: QuestionCreate) -> Question:
-    answers_data = question_in.answers or []
-    question_data = question_in.model_dump(exclude={"answers"})
-
-    db_question = Question(**question_data)
+async def create_question(db: AsyncSession, *, question_in: QuestionCreate) -> Question:
+    """Stage a question and its answers; the caller owns the transaction.
+
+    Only flushes (to assign the primary key), so a batch of questions plus
+    the quiz that links them commits as one transaction instead of one
+    commit per question.
+    """
+    # Build the rows straight from the validated schema attributes; the
+    # incoming payload was already validated, so round-tripping through
+    # model_dump()/model_validate() only allocates throwaway dicts.
+    db_question = Question(
+        text=question_in.text,
+        question_type=question_in.question_type,
+        difficulty=question_in.difficulty,
+    )
 
-    db_answers = []
-    for answer_data in answers_data:
-        db_answer = Answer.model_validate(answer_data)
-        db_answer.question = db_question
-        db_answers.append(db_answer)
-        db.add(db_answer)
+    db_answers = [
+        Answer(
+            text=answer_in.text,
+            is_correct=answer_in.is_correct,
+            question=db_question,
+        )
+        for answer_in in question_in.answers or []
+    ]
 
     db.add(db_question)
-    db.commit()
-    db.refresh(db_question)
-    # for ans in db_answers:
-    #     db.refresh(ans)
+    db.add_all(db_answers)
+    await db.flush()
     return db_question
 
 
-def get_question(db: Session, question_id: int) -> Question | None:
-    return db.get(Question, question_id)
+async def get_question(db: AsyncSession, question_id: int) -> Question | None:
+    return await db.get(Question, question_id)
 
 
-def get_questions(db: Session, skip: int = 0, limit: int = 100) -> Sequence[Question]:
-    statement = select(Question).offset(skip).limit(limit)
-    result = db.exec(statement)
+async def get_questions(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Question]:
+    statement = select(Question).order_by(Question.id)
+    if after_id is not None:
+        statement = statement.where(Question.id > after_id)
+    else:
+        statement = statement.offset(skip)
+    result = await db.exec(statement.limit(limit))
     return result.all()
 
 
-def get_questions_by_ids(db: Session, question_ids: List[int]) -> Sequence[Question]:
+async def get_questions_by_ids(
+    db: AsyncSession, question_ids: List[int]
+) -> List[Question]:
     if not question_ids:
         return []
     statement = select(Question).where(Question.id.in_(question_ids))
-    result = db.exec(statement)
-    return result.all()
-
-
-def get_answer(db: Session, answer_id: int) -> Answer | None:
-    return db.get(Answer, answer_id)
+    result = await db.exec(statement)
+    # IN (...) returns rows in storage order; hand them back in the order
+    # the caller asked for, silently dropping IDs that do not exist.
+    questions_by_id = {question.id: question for question in result.all()}
+    return [
+        questions_by_id[question_id]
+        for question_id in question_ids
+        if question_id in questions_by_id
+    ]
+
+
+async def get_answer(db: AsyncSession, answer_id: int) -> Answer | None:
+    return await db.get(Answer, answer_id)
@@ -1,27 +1,58 @@
 import logging
 
-from sqlmodel import Session, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_engine: AsyncEngine | None = None
 
-try:
-    engine = create_engine(
-        settings.DATABASE_URL,
-        echo=False,
-        pool_pre_ping=True,
-        pool_recycle=3600,
+
+def _async_database_url() -> str:
+    # settings.DATABASE_URL stays a plain postgresql:// DSN so alembic can
+    # keep using the sync psycopg2 driver; the API itself talks to Postgres
+    # through asyncpg.
+    return str(settings.DATABASE_URL).replace(
+        "postgresql://", "postgresql+asyncpg://", 1
     )
-    logger.info("Database engine and session created successfully.")
-except Exception as e:
-    logger.error(f"Error creating database engine/session: {e}")
-    raise
 
 
-def get_db():
-    with Session(engine) as db:
+def get_engine() -> AsyncEngine:
+    """Build the engine on first use instead of at import.
+
+    Importing app modules (tests, alembic, scripts) no longer constructs an
+    engine as a side effect; only code that actually opens a session pays
+    for it, and misconfiguration surfaces at the first request rather than
+    at import time.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            _async_database_url(),
+            echo=False,
+            # A short recycle bounds how long an idle connection can silently
+            # die behind a NAT/proxy, replacing the SELECT 1 round-trip that
+            # pool_pre_ping added to every checkout.
+            pool_recycle=300,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            # Hot lookups (get_quiz, get_quiz_by_jd_id, the listings) reuse a
+            # handful of statement shapes; a larger per-connection prepared-
+            # statement cache keeps them parsed/planned across requests.
+            connect_args={"statement_cache_size": 256},
+        )
+        logger.info("Database engine created successfully.")
+    return _engine
+
+
+async def get_db():
+    # expire_on_commit=False keeps loaded attributes usable after commit;
+    # otherwise every post-commit attribute access would need an explicit
+    # awaited refresh.
+    async with AsyncSession(get_engine(), expire_on_commit=False) as db:
         try:
             yield db
         except Exception as e:
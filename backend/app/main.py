@@ -1,21 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1.endpoints import quiz_endpoints
 from app.core.config import settings
+from app.utils.responses import ORJSONResponse
 
 app = FastAPI(
     title="JD Quiz Generator API",
     version="0.1.0",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-origins = [
+# Immutable so the middleware's per-request membership check works against
+# a fixed tuple; add production frontend origins here.
+origins = (
     "http://localhost:3000",
     # "https://your-frontend-domain.com",
-]
+)
+
 
+# Compress large list responses (quizzes with nested questions/answers can
+# easily exceed 100KB); small payloads are passed through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,7 +34,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(quiz_endpoints.router, prefix=settings.API_V1_STR, tags=["Quiz App"])
+# Single registration point for all v1 routers; new endpoint modules only
+# need an entry here. Routes are compiled into one table at startup rather
+# than scattered include_router calls.
+API_V1_ROUTERS = (
+    (quiz_endpoints.router, ["Quiz App"]),
+)
+
+for api_router, api_tags in API_V1_ROUTERS:
+    app.include_router(api_router, prefix=settings.API_V1_STR, tags=api_tags)
 
 
 @app.get("/")
@@ -1,6 +1,7 @@
 import enum
-from datetime import datetime, timezone
+from datetime import datetime
 
+from sqlalchemy import func
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 
@@ -25,8 +26,10 @@ class QuizQuestionLink(SQLModel, table=True):
 class JobDescription(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     original_text: str = Field(nullable=False)
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), nullable=False
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
 
     generated_quiz: "Quiz" = Relationship(back_populates="source_jd")
@@ -37,8 +40,10 @@ class Question(SQLModel, table=True):
     text: str
     question_type: QuestionType = Field(default=QuestionType.SINGLE_CHOICE)
     difficulty: DifficultyLevel = Field(default=DifficultyLevel.MEDIUM)
-    created_at: datetime = Field(
-        default_factory=datetime.now(timezone.utc), nullable=False
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
 
     answers: list["Answer"] = Relationship(back_populates="question")
@@ -49,11 +54,13 @@ class Question(SQLModel, table=True):
 
 class Answer(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
-    question_id: int = Field(foreign_key="question.id")
+    question_id: int = Field(foreign_key="question.id", index=True)
     text: str
     is_correct: bool = Field(default=False)
-    created_at: datetime = Field(
-        default_factory=datetime.now(timezone.utc), nullable=False
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
 
     question: "Question" = Relationship(back_populates="answers")
@@ -67,11 +74,15 @@ class Quiz(SQLModel, table=True):
     time_limit_seconds: int = Field(nullable=False)
     tags: list[str] | None = Field(default=None, sa_column=Column(JSON))
 
-    created_at: datetime = Field(
-        default_factory=datetime.now(timezone.utc), nullable=False
+    created_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
-    updated_at: datetime = Field(
-        default_factory=datetime.now(timezone.utc), nullable=False
+    updated_at: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
     source_jd_id: int | None = Field(
         default=None, foreign_key="jobdescription.id", nullable=True, unique=True
@@ -1,26 +1,37 @@
 from datetime import datetime
 
-from sqlmodel import SQLModel
+from pydantic import BaseModel, ConfigDict
 
 from app.models.quiz_models import DifficultyLevel, QuestionType
 
 
-class JobDescriptionBase(SQLModel):
+class BaseSchema(BaseModel):
+    """Plain pydantic base for API DTOs.
+
+    These classes never map to tables, so they skip SQLModel's table
+    metaclass entirely; from_attributes lets Read schemas validate straight
+    from ORM rows.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobDescriptionBase(BaseSchema):
     original_text: str
 
 
-class AnswerBase(SQLModel):
+class AnswerBase(BaseSchema):
     text: str
     is_correct: bool = False
 
 
-class QuestionBase(SQLModel):
+class QuestionBase(BaseSchema):
     text: str
     question_type: QuestionType = QuestionType.SINGLE_CHOICE
     difficulty: DifficultyLevel = DifficultyLevel.MEDIUM
 
 
-class QuizBase(SQLModel):
+class QuizBase(BaseSchema):
     title: str
     description: str | None = None
     difficulty: DifficultyLevel
@@ -28,14 +39,14 @@ class QuizBase(SQLModel):
     tags: list[str] | None = None
 
 
-class QuizReadMinimal(SQLModel):
+class QuizReadMinimal(BaseSchema):
     id: int
     title: str
     difficulty: DifficultyLevel
     created_at: datetime
 
 
-class JobDescriptionReadMinimal(SQLModel):
+class JobDescriptionReadMinimal(BaseSchema):
     id: int
     created_at: datetime
     original_text: str | None = None
@@ -78,17 +89,17 @@ class JobDescriptionRead(JobDescriptionBase):
     generated_quiz: QuizReadMinimal | None = None
 
 
-class GenerateQuizRequest(SQLModel):
+class GenerateQuizRequest(BaseSchema):
     job_description_text: str
     # desired_difficulty: DifficultyLevel | None = None
 
 
-class GenerateQuizResponse(SQLModel):
+class GenerateQuizResponse(BaseSchema):
     job_description: JobDescriptionRead
     # quiz: QuizRead
 
 
-class MatchQuizRequest(SQLModel):
+class MatchQuizRequest(BaseSchema):
     job_description_text: str | None = None
     tags: list[str] | None = None
 
@@ -99,5 +110,5 @@ class MatchedQuizInfo(QuizReadMinimal):
     description: str | None = None
 
 
-class MatchQuizResponse(SQLModel):
+class MatchQuizResponse(BaseSchema):
     matched_quizzes: list[MatchedQuizInfo] = []
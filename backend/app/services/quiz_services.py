@@ -2,7 +2,8 @@ import logging
 from typing import List, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from pydantic import TypeAdapter
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud import quiz_crud
 from app.models.quiz_models import DifficultyLevel, Question, QuestionType
@@ -17,6 +18,10 @@ from app.utils import ai_integration
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; validates a whole AI answer list in a single
+# call instead of building a validator per answer dict.
+_ANSWER_LIST_ADAPTER = TypeAdapter(List[AnswerCreate])
+
 
 def _calculate_time_limit(difficulty: DifficultyLevel) -> int:
     if difficulty == DifficultyLevel.EASY:
@@ -29,12 +34,12 @@ def _calculate_time_limit(difficulty: DifficultyLevel) -> int:
         return 15 * 60
 
 
-async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
+async def generate_quiz_for_jd(db: AsyncSession, jd_text: str) -> JobDescriptionRead:
     logger.info("Starting quiz generation process for new Job Description.")
 
     try:
         jd_create_schema = JobDescriptionCreate(original_text=jd_text)
-        db_jd = quiz_crud.create_job_description(db=db, jd_in=jd_create_schema)
+        db_jd = await quiz_crud.create_job_description(db=db, jd_in=jd_create_schema)
         logger.info(f"Created JobDescription record with ID: {db_jd.id}")
     except Exception as e:
         logger.error(f"Failed to create JobDescription record: {e}", exc_info=True)
@@ -43,16 +48,10 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
             detail="Failed to save job description.",
         )
 
-    existing_quiz = quiz_crud.get_quiz_by_jd_id(db=db, jd_id=db_jd.id)
-    if existing_quiz:
-        logger.warning(
-            f"Quiz already exists for JobDescription ID: {db_jd.id}. Returning existing data."
-        )
-        db.refresh(db_jd, attribute_names=["generated_quiz"])
-        return JobDescriptionRead.model_validate(db_jd)
-
     logger.info(f"Processing Job Description ID: {db_jd.id} with AI...")
-    ai_result = ai_integration.process_jd_with_ai(job_description_text=jd_text)
+    ai_result = await ai_integration.process_jd_with_ai(
+        job_description_text=jd_text
+    )
 
     if not ai_result:
         logger.error(f"AI processing failed for Job Description ID: {db_jd.id}.")
@@ -71,17 +70,25 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
             )
 
         for q_data in ai_questions:
-            answers_create = [
-                AnswerCreate.model_validate(ans_data)
-                for ans_data in q_data.get("answers", [])
-            ]
+            answers_create = _ANSWER_LIST_ADAPTER.validate_python(
+                q_data.get("answers", [])
+            )
+            # A question with no answer options is unusable; skip it before
+            # paying for the INSERTs rather than persisting a dead row.
+            if not answers_create:
+                logger.warning(
+                    f"Skipping AI question with no answers for JD ID: {db_jd.id}."
+                )
+                continue
             question_create = QuestionCreate(
                 text=q_data.get("text", "Missing question text"),
                 question_type=q_data.get("question_type", QuestionType.SINGLE_CHOICE),
                 difficulty=q_data.get("difficulty", DifficultyLevel.MEDIUM),
                 answers=answers_create,
             )
-            db_question = quiz_crud.create_question(db=db, question_in=question_create)
+            db_question = await quiz_crud.create_question(
+                db=db, question_in=question_create
+            )
             created_questions.append(db_question)
         logger.info(
             f"Created {len(created_questions)} questions for JD ID: {db_jd.id}."
@@ -101,7 +108,7 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
     time_limit = _calculate_time_limit(quiz_difficulty)
 
     try:
-        db_quiz = quiz_crud.create_quiz_linked_to_jd(
+        db_quiz = await quiz_crud.create_quiz_linked_to_jd(
             db=db,
             source_jd=db_jd,
             title=ai_result.get("title", f"Quiz for Job ID {db_jd.id}"),
@@ -115,7 +122,7 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
             f"Successfully created Quiz ID: {db_quiz.id} linked to JD ID: {db_jd.id}."
         )
 
-        db.refresh(db_jd, attribute_names=["generated_quiz"])
+        await db.refresh(db_jd, attribute_names=["generated_quiz"])
 
         return JobDescriptionRead.model_validate(db_jd)
 
@@ -123,7 +130,7 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
         logger.warning(
             f"Attempted to create duplicate quiz link for JD ID: {db_jd.id}: {ve}"
         )
-        db.refresh(db_jd, attribute_names=["generated_quiz"])
+        await db.refresh(db_jd, attribute_names=["generated_quiz"])
         return JobDescriptionRead.model_validate(db_jd)
     except Exception as e:
         logger.error(
@@ -136,7 +143,7 @@ async def generate_quiz_for_jd(db: Session, jd_text: str) -> JobDescriptionRead:
 
 
 async def find_matching_quizzes(
-    db: Session,
+    db: AsyncSession,
     jd_text: Optional[str] = None,
     tags: Optional[List[str]] = None,
     limit: int = 10,
@@ -147,7 +154,7 @@ async def find_matching_quizzes(
         logger.info(
             "No tags provided, attempting to extract tags from JD text using AI..."
         )
-        target_tags = ai_integration.extract_tags_with_ai(jd_text)
+        target_tags = await ai_integration.extract_tags_with_ai(jd_text)
         if not target_tags:
             logger.warning("AI failed to extract tags from the provided text.")
             return []
@@ -158,7 +165,7 @@ async def find_matching_quizzes(
         return []
 
     try:
-        matched_db_quizzes = quiz_crud.get_quizzes_by_tags(
+        matched_db_quizzes = await quiz_crud.get_quizzes_by_tags(
             db=db, tags_to_match=target_tags, require_all=False, limit=limit
         )
     except NotImplementedError:
@@ -172,18 +179,18 @@ async def find_matching_quizzes(
         logger.error(f"Database error during tag matching: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to query quizzes by tags.")
 
+    # Stored tags are normalized at write time; only the incoming tags need
+    # normalizing, once, outside the loop.
+    target_tag_set = set(quiz_crud.normalize_tags(target_tags) or [])
+
     results: List[MatchedQuizInfo] = []
     for quiz in matched_db_quizzes:
         score = 0.0
         if quiz.tags:
-            common_tags = set(tag.lower() for tag in target_tags) & set(
-                tag.lower() for tag in quiz.tags
-            )
-            union_tags = set(tag.lower() for tag in target_tags) | set(
-                tag.lower() for tag in quiz.tags
-            )
+            quiz_tag_set = set(quiz.tags)
+            union_tags = target_tag_set | quiz_tag_set
             if union_tags:
-                score = len(common_tags) / len(union_tags)
+                score = len(target_tag_set & quiz_tag_set) / len(union_tags)
 
         results.append(
             MatchedQuizInfo(
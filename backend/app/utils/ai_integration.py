@@ -1,9 +1,17 @@
-import json
+import asyncio
+import copy
+import hashlib
 import logging
+import re
+import time
+from collections import OrderedDict
+from string import Template
 from typing import Any, Dict, List, Optional
 
+import orjson
 import vertexai
 from google.api_core import exceptions as google_exceptions
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from vertexai.generative_models import GenerationConfig, GenerativeModel, Part
 
 from app.core.config import settings
@@ -11,55 +19,57 @@ from app.models.quiz_models import DifficultyLevel, QuestionType  # Import Enums
 
 logger = logging.getLogger(__name__)
 
-try:
+_vertex_initialized = False
+_model: Optional[GenerativeModel] = None
+
+# Back-pressure for the model endpoint: at most VERTEX_CONCURRENCY
+# generate calls in flight per worker, so a burst of submissions queues
+# here instead of fanning out into Vertex quota errors.
+_VERTEX_SEMAPHORE = asyncio.Semaphore(settings.VERTEX_CONCURRENCY)
+
+
+def _ensure_vertex_initialized() -> None:
+    """Initialize the Vertex AI SDK on first use.
+
+    Running vertexai.init at import made every import of this module (app
+    startup, alembic, tests) pay for credential resolution and killed the
+    process with SystemExit when GCP config was absent. Callers now
+    trigger it lazily and a failure only fails the AI request.
+    """
+    global _vertex_initialized
+    if _vertex_initialized:
+        return
     if not settings.GCP_PROJECT_ID:
-        raise ValueError("GCP_PROJECT_ID is not set in the environment/config.")
+        raise RuntimeError("GCP_PROJECT_ID is not set in the environment/config.")
     vertexai.init(project=settings.GCP_PROJECT_ID, location=settings.GCP_LOCATION)
     logger.info(
         f"Vertex AI initialized successfully for project '{settings.GCP_PROJECT_ID}' in location '{settings.GCP_LOCATION}'."
     )
-except Exception as e:
-    logger.error(f"Failed to initialize Vertex AI: {e}", exc_info=True)
-    raise SystemExit(f"Fatal Error: Could not initialize Vertex AI: {e}")
-
-
-def _parse_ai_json_response(response_text: str) -> Optional[Dict[str, Any]]:
-    try:
-        if response_text.strip().startswith("```json"):
-            json_str = response_text.strip().split("```json")[1].split("```")[0].strip()
-        elif response_text.strip().startswith("{") and response_text.strip().endswith(
-            "}"
-        ):
-            json_str = response_text.strip()
-        else:
-            logger.warning(
-                f"AI response does not appear to be well-formed JSON:\n{response_text}"
-            )
-            return None
+    _vertex_initialized = True
 
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        logger.error(
-            f"Failed to decode JSON from AI response: {e}\nResponse text:\n{response_text}",
-            exc_info=True,
-        )
-        return None
-    except Exception as e:
-        logger.error(
-            f"An unexpected error occurred during JSON parsing: {e}\nResponse text:\n{response_text}",
-            exc_info=True,
-        )
-        return None
 
+def _get_model() -> GenerativeModel:
+    """Return the process-wide GenerativeModel, building it on first use.
 
-def process_jd_with_ai(job_description_text: str) -> Optional[Dict[str, Any]]:
-    if not vertexai._is_initialized():
-        logger.error("Vertex AI is not initialized. Cannot process JD.")
-        return None
-
-    model = GenerativeModel(settings.VERTEX_AI_MODEL_NAME)
-
-    prompt = f"""
+    The model object is a lightweight handle but still re-resolved settings
+    and SDK state on every call; one instance serves all requests.
+    """
+    global _model
+    if _model is None:
+        _ensure_vertex_initialized()
+        _model = GenerativeModel(settings.VERTEX_AI_MODEL_NAME)
+    return _model
+
+
+# Matches an optional ```json fenced block and captures its payload;
+# compiled once instead of re-slicing the response string per call.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.+?)\s*```", re.DOTALL)
+
+# Prompt bodies are fixed apart from the user text, so they are assembled
+# once at import (enum values baked in) and only the variable pieces are
+# substituted per call. string.Template leaves the JSON braces alone.
+_JD_PROMPT_TEMPLATE = Template(
+    f"""
     Analyze the following job description provided below. Based on the analysis, perform the following tasks:
 
     1.  **Determine Overall Difficulty:** Classify the role's overall difficulty level as "easy", "medium", or "hard" based on required skills, experience, and responsibilities.
@@ -99,25 +109,157 @@ def process_jd_with_ai(job_description_text: str) -> Optional[Dict[str, Any]]:
 
     **Job Description:**
     ---
-    {job_description_text}
+    $job_description_text
     ---
     """
+)
+
+_TAG_PROMPT_TEMPLATE = Template(
+    """
+    Analyze the following text content and extract the $max_tags most relevant technical skills,
+    tools, concepts, or experience level keywords as a list of tags.
+
+    Output Format: Respond ONLY with a valid JSON list of strings. Example: ["python", "api", "sql", "data analysis"]
+
+    Text Content:
+    ---
+    $text_content
+    ---
+    """
+)
+
+# Private schemas for the model's quiz payload. Validating in one
+# model_validate pass replaces the hand-written key/isinstance checks and
+# the per-question enum conversion loop, and rejects malformed payloads
+# with a single, loggable error.
+class _AIAnswerPayload(BaseModel):
+    text: str
+    is_correct: bool = False
+
+
+class _AIQuestionPayload(BaseModel):
+    text: str
+    question_type: QuestionType = QuestionType.SINGLE_CHOICE
+    difficulty: DifficultyLevel = DifficultyLevel.MEDIUM
+    answers: List[_AIAnswerPayload] = Field(default_factory=list)
+
+    @field_validator("question_type", "difficulty", mode="before")
+    @classmethod
+    def _lowercase(cls, value: Any) -> Any:
+        # The model occasionally capitalizes enum values ("Easy").
+        return value.lower() if isinstance(value, str) else value
+
+
+class _AIQuizPayload(BaseModel):
+    title: str
+    description: Optional[str] = None
+    difficulty: DifficultyLevel
+    tags: List[str] = Field(default_factory=list)
+    questions: List[_AIQuestionPayload]
+
+    @field_validator("difficulty", mode="before")
+    @classmethod
+    def _lowercase(cls, value: Any) -> Any:
+        return value.lower() if isinstance(value, str) else value
+
+
+# Vertex calls dominate request latency and are deterministic enough that
+# resubmitting the same job description should not pay for a second model
+# round-trip. Results are cached in-process, keyed by a content hash, with
+# a TTL and an LRU bound so the cache cannot grow without limit.
+_JD_RESULT_CACHE: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_JD_RESULT_CACHE_MAX_ENTRIES = 256
+_JD_RESULT_CACHE_TTL_SECONDS = 86400
+
 
-    generation_config = GenerationConfig(
-        response_mime_type="application/json",  # Use if model version supports it directly
-        temperature=0.6,
-        top_p=0.9,
-        max_output_tokens=4096,
+def _jd_cache_key(job_description_text: str) -> str:
+    return hashlib.blake2b(
+        job_description_text.encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _jd_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    entry = _JD_RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    cached_at, result = entry
+    if time.monotonic() - cached_at > _JD_RESULT_CACHE_TTL_SECONDS:
+        del _JD_RESULT_CACHE[key]
+        return None
+    _JD_RESULT_CACHE.move_to_end(key)
+    # Deep copy so callers mutating the result cannot corrupt the cache.
+    return copy.deepcopy(result)
+
+
+def _jd_cache_put(key: str, result: Dict[str, Any]) -> None:
+    _JD_RESULT_CACHE[key] = (time.monotonic(), copy.deepcopy(result))
+    _JD_RESULT_CACHE.move_to_end(key)
+    while len(_JD_RESULT_CACHE) > _JD_RESULT_CACHE_MAX_ENTRIES:
+        _JD_RESULT_CACHE.popitem(last=False)
+
+
+_JD_GENERATION_CONFIG = GenerationConfig(
+    response_mime_type="application/json",  # Use if model version supports it directly
+    temperature=0.6,
+    top_p=0.9,
+    max_output_tokens=4096,
+)
+_TAG_GENERATION_CONFIG = GenerationConfig(temperature=0.2, max_output_tokens=512)
+
+
+def _parse_ai_json_response(response_text: str) -> Optional[Dict[str, Any]]:
+    text = response_text.strip()
+    fence_match = _JSON_FENCE_RE.search(text)
+    if fence_match:
+        json_str = fence_match.group(1)
+    elif (text.startswith("{") and text.endswith("}")) or (
+        text.startswith("[") and text.endswith("]")
+    ):
+        json_str = text
+    else:
+        logger.warning(
+            f"AI response does not appear to be well-formed JSON:\n{response_text}"
+        )
+        return None
+
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
+        logger.error(
+            f"Failed to decode JSON from AI response: {e}\nResponse text:\n{response_text}",
+            exc_info=True,
+        )
+        return None
+
+
+async def process_jd_with_ai(
+    job_description_text: str,
+) -> Optional[Dict[str, Any]]:
+    cache_key = _jd_cache_key(job_description_text)
+    cached_result = _jd_cache_get(cache_key)
+    if cached_result is not None:
+        logger.info("Returning cached AI result for resubmitted job description.")
+        return cached_result
+
+    try:
+        model = _get_model()
+    except Exception as e:
+        logger.error(f"Vertex AI initialization failed: {e}", exc_info=True)
+        return None
+
+    prompt = _JD_PROMPT_TEMPLATE.substitute(
+        job_description_text=job_description_text
     )
 
     try:
         logger.info(
             f"Sending request to Vertex AI Gemini model '{settings.VERTEX_AI_MODEL_NAME}'..."
         )
-        response = model.generate_content(
-            [Part.from_text(prompt)],
-            generation_config=generation_config,
-        )
+        async with _VERTEX_SEMAPHORE:
+            response = await model.generate_content_async(
+                [Part.from_text(prompt)],
+                generation_config=_JD_GENERATION_CONFIG,
+            )
         logger.info("Received response from Vertex AI.")
 
         if not response.candidates or not response.candidates[0].content.parts:
@@ -130,32 +272,18 @@ def process_jd_with_ai(job_description_text: str) -> Optional[Dict[str, Any]]:
         parsed_data = _parse_ai_json_response(ai_response_text)
 
         if parsed_data:
-            if not all(
-                k in parsed_data for k in ["title", "difficulty", "tags", "questions"]
-            ):
-                logger.error("Parsed AI JSON response is missing required keys.")
-                return None
-            if not isinstance(parsed_data["questions"], list):
-                logger.error("Parsed AI JSON 'questions' field is not a list.")
-                return None
             try:
-                parsed_data["difficulty"] = DifficultyLevel(
-                    parsed_data["difficulty"].lower()
-                )
-                for q in parsed_data["questions"]:
-                    if "difficulty" in q:
-                        q["difficulty"] = DifficultyLevel(q["difficulty"].lower())
-                    if "question_type" in q:
-                        q["question_type"] = QuestionType(q["question_type"].lower())
-
-            except ValueError as e:
-                logger.error(
-                    f"Invalid difficulty or question_type value in AI response: {e}"
-                )
+                payload = _AIQuizPayload.model_validate(parsed_data)
+            except ValidationError as e:
+                logger.error(f"AI response failed schema validation: {e}")
                 return None
 
+            # mode="python" keeps the coerced enum members intact for the
+            # service layer.
+            result = payload.model_dump()
             logger.info("Successfully processed job description with AI.")
-            return parsed_data
+            _jd_cache_put(cache_key, result)
+            return result
         else:
             logger.error("Failed to parse valid JSON from AI response.")
             return None
@@ -170,31 +298,25 @@ def process_jd_with_ai(job_description_text: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def extract_tags_with_ai(text_content: str, max_tags: int = 10) -> Optional[List[str]]:
-    if not vertexai._is_initialized():
-        logger.error("Vertex AI is not initialized. Cannot extract tags.")
+async def extract_tags_with_ai(
+    text_content: str, max_tags: int = 10
+) -> Optional[List[str]]:
+    try:
+        model = _get_model()
+    except Exception as e:
+        logger.error(f"Vertex AI initialization failed: {e}", exc_info=True)
         return None
-
-    model = GenerativeModel(settings.VERTEX_AI_MODEL_NAME)
-    prompt = f"""
-    Analyze the following text content and extract the {max_tags} most relevant technical skills,
-    tools, concepts, or experience level keywords as a list of tags.
-
-    Output Format: Respond ONLY with a valid JSON list of strings. Example: ["python", "api", "sql", "data analysis"]
-
-    Text Content:
-    ---
-    {text_content}
-    ---
-    """
-    generation_config = GenerationConfig(temperature=0.2, max_output_tokens=512)
+    prompt = _TAG_PROMPT_TEMPLATE.substitute(
+        max_tags=max_tags, text_content=text_content
+    )
 
     try:
         logger.info("Requesting tag extraction from Vertex AI for text snippet...")
-        response = model.generate_content(
-            [Part.from_text(prompt)],
-            generation_config=generation_config,
-        )
+        async with _VERTEX_SEMAPHORE:
+            response = await model.generate_content_async(
+                [Part.from_text(prompt)],
+                generation_config=_TAG_GENERATION_CONFIG,
+            )
 
         if not response.candidates or not response.candidates[0].content.parts:
             logger.warning("Vertex AI tag extraction response was empty.")
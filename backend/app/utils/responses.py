@@ -0,0 +1,69 @@
+import hashlib
+import logging
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from sqlmodel import SQLModel
+
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; orjson re-parses the option bitmask on every
+# dumps() call, so build it a single time. UTC datetimes render with the
+# Z suffix and non-string dict keys (e.g. int IDs) are allowed.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, SQLModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Used on list endpoints instead of `response_model=List[...]` so FastAPI
+    does not run `jsonable_encoder` plus a second pydantic validation pass
+    over every row before serializing. orjson natively handles `datetime`,
+    `date` and `uuid.UUID`; `_orjson_default` covers `Decimal` and stray
+    SQLModel instances.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+def etag_json_response(
+    request: Request,
+    content: Any,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """Render `content` with orjson and honour conditional requests.
+
+    The ETag is a hash of the rendered body, so near-static catalog
+    responses cost a 304 with no payload when the client already holds the
+    current version.
+    """
+    body = orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+    response_headers = {"ETag": etag}
+    if headers:
+        response_headers.update(headers)
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=response_headers
+        )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=response_headers,
+    )